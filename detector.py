@@ -1,28 +1,55 @@
 """
 Language detector module that combines multiple detection methods
 """
+import asyncio
 import logging
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Dict, List, Tuple, Union, Optional
 
 # Import language detection libraries
 from langdetect import detect as langdetect_detect
 from langdetect import DetectorFactory
+from langdetect.detector_factory import init_factory as langdetect_init_factory
 from textblob import TextBlob
 from googletrans import Translator
 
 # Import spaCy for language detection
 import spacy
+
+# Only doc._.language is read, so the rest of the pipeline is not run
+SPACY_DISABLED_PIPES = ["ner", "tagger", "parser", "attribute_ruler", "lemmatizer"]
+
+# Number of texts spaCy processes per batch in detect_batch
+SPACY_BATCH_SIZE = 64
+
 try:
     # Try to load the language detector model
-    spacy_model = spacy.load("xx_ent_wiki_sm")
+    spacy_model = spacy.load("xx_ent_wiki_sm", disable=SPACY_DISABLED_PIPES)
     SPACY_AVAILABLE = True
 except (OSError, ImportError):
     SPACY_AVAILABLE = False
     spacy_model = None
 
+# Import fastText for offline language identification (optional)
+FASTTEXT_MODEL_PATH = os.environ.get("FASTTEXT_MODEL_PATH", "lid.176.bin")
+try:
+    import fasttext
+    # Try to load the lid.176 language identification model
+    fasttext_model = fasttext.load_model(FASTTEXT_MODEL_PATH) if os.path.exists(FASTTEXT_MODEL_PATH) else None
+    FASTTEXT_AVAILABLE = fasttext_model is not None
+except (ValueError, ImportError):
+    FASTTEXT_AVAILABLE = False
+    fasttext_model = None
+
 # Import utility functions
-from .utils import clean_text, format_confidence, get_language_name, is_english
-from .text_processor import advanced_clean_text, calculate_weighted_confidence, get_language_family
+from .utils import canonical_language_code, clean_text, format_confidence, get_language_name, is_english
+from .text_processor import (advanced_clean_text, calculate_weighted_confidence,
+                             detect_script_language, get_language_family)
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, 
@@ -32,6 +59,30 @@ logger = logging.getLogger(__name__)
 # Set seed for reproducibility in langdetect
 DetectorFactory.seed = 0
 
+# langdetect loads its language profiles on first use without a lock, and
+# publishes the factory before loading finishes, so concurrent first calls
+# can classify against a partial profile set. Load them once here instead.
+langdetect_init_factory()
+
+# Detection accuracy saturates long before this many characters, so only
+# this prefix of the cleaned text is passed to the detectors
+MAX_DETECTION_LENGTH = 2000
+
+# Methods that send the text to a web service; these are left out of
+# combined detection unless the detector is created with online=True
+ONLINE_METHODS = ('textblob', 'googletrans')
+
+# Seconds after which a googletrans session is discarded and recreated
+TRANSLATOR_TTL = 540
+
+# Error googletrans raises when Google answers with a non-200 status
+GOOGLETRANS_STATUS_ERROR_RE = re.compile(r'Unexpected status code "(\d+)"')
+
+# Statuses after which a request is retried once on a fresh session; they
+# mean the session was refused. Others, like 429 rate limiting, are not
+# retried, as an immediate second request would only add load.
+TRANSLATOR_RETRY_STATUSES = frozenset({401, 403})
+
 
 class LanguageDetector:
     """
@@ -39,8 +90,19 @@ class LanguageDetector:
     for more accurate language identification
     """
     
-    def __init__(self):
-        """Initialize the language detector with available detection methods"""
+    # googletrans clients are not safe to share between threads, so each
+    # thread keeps its own Translator, shared by all detector instances
+    _translator_local = threading.local()
+    
+    def __init__(self, online: bool = False):
+        """
+        Initialize the language detector with available detection methods
+        
+        Args:
+            online: Whether combined detection also queries the network-based
+                methods (textblob, googletrans). They can always be selected
+                explicitly through the method argument of detect.
+        """
         self.methods = {
             'langdetect': self._detect_with_langdetect,
             'textblob': self._detect_with_textblob,
@@ -51,10 +113,86 @@ class LanguageDetector:
         if SPACY_AVAILABLE:
             self.methods['spacy'] = self._detect_with_spacy
         
-        # Initialize translator for googletrans
-        self.translator = Translator()
+        # Add fastText if the model is available
+        if FASTTEXT_AVAILABLE:
+            self.methods['fasttext'] = self._detect_with_fasttext
+        
+        # Methods combined when no specific method is requested
+        self.default_methods = [
+            name for name in self.methods
+            if online or name not in ONLINE_METHODS
+        ]
+        
+        # Methods that can detect a list of texts in a single call
+        self.batch_methods = {}
+        if SPACY_AVAILABLE:
+            self.batch_methods['spacy'] = self._detect_batch_with_spacy
+        if FASTTEXT_AVAILABLE:
+            self.batch_methods['fasttext'] = self._detect_batch_with_fasttext
+        
+        # Request queue used by detect_async, created on first use
+        self._batch_queue = None
+        
+        # Thread pool shared by detect calls to run the default methods concurrently
+        self._method_executor = ThreadPoolExecutor(thread_name_prefix='detect-method')
+        
+        # Thread pool used by detect_batch, sized to the largest workers value
+        # requested so far. It lives as long as the detector so that the
+        # per-thread googletrans sessions are reused from one batch to the next.
+        self._batch_executor = None
+        self._batch_workers = 0
+        self._batch_executor_lock = threading.Lock()
+        
+        logger.info(f"Language detector initialized with methods: {list(self.methods.keys())}, "
+                    f"combining: {self.default_methods}")
+    
+    @property
+    def translator(self) -> Translator:
+        """Translator instance owned by the calling thread, refreshed after TRANSLATOR_TTL"""
+        local = self._translator_local
+        translator = getattr(local, 'translator', None)
+        if translator is not None and time.monotonic() >= local.expires_at:
+            self._discard_translator()
+            translator = None
+        if translator is None:
+            translator = Translator()
+            # googletrans 4.0.0-rc1 checks the response status against this
+            # misspelt attribute; without it a rejected request fails with an
+            # AttributeError instead of its status error
+            translator.raise_Exception = True
+            local.translator = translator
+            local.expires_at = time.monotonic() + TRANSLATOR_TTL
+        return translator
+    
+    def _discard_translator(self) -> None:
+        """Close the calling thread's Translator session and forget it"""
+        local = self._translator_local
+        translator = getattr(local, 'translator', None)
+        local.translator = None
+        if translator is not None:
+            translator.client.close()
+    
+    def _translator_detect(self, text: str):
+        """
+        Call googletrans detect, retrying once with a fresh session if Google
+        refuses the session (TRANSLATOR_RETRY_STATUSES)
         
-        logger.info(f"Language detector initialized with methods: {list(self.methods.keys())}")
+        Args:
+            text: Input text to detect
+            
+        Returns:
+            googletrans Detected object
+        """
+        try:
+            return self.translator.detect(text)
+        except Exception as e:
+            # Timeouts, throttling and unparsable responses are not retried
+            match = GOOGLETRANS_STATUS_ERROR_RE.match(str(e))
+            if match is None or int(match.group(1)) not in TRANSLATOR_RETRY_STATUSES:
+                raise
+            logger.info(f"googletrans request failed, retrying with a new session: {e}")
+            self._discard_translator()
+            return self.translator.detect(text)
     
     def _detect_with_langdetect(self, text: str) -> Tuple[str, float]:
         """
@@ -106,13 +244,13 @@ class LanguageDetector:
             
         Returns:
             Tuple of (language_code, confidence)
+            
+        Raises:
+            Exception: If the request to Google fails; _run_method reports
+                such transient errors as failed results
         """
-        try:
-            detection = self.translator.detect(text)
-            return detection.lang, detection.confidence
-        except Exception as e:
-            logger.warning(f"googletrans detection failed: {e}")
-            return "unknown", 0.0
+        detection = self._translator_detect(text)
+        return detection.lang, detection.confidence
     
     def _detect_with_spacy(self, text: str) -> Tuple[str, float]:
         """
@@ -133,6 +271,57 @@ class LanguageDetector:
             logger.warning(f"spaCy detection failed: {e}")
             return "unknown", 0.0
     
+    def _detect_batch_with_spacy(self, texts: List[str]) -> List[Tuple[str, float]]:
+        """
+        Detect languages of several texts with a single spaCy pipe
+        
+        Args:
+            texts: Input texts to detect
+            
+        Returns:
+            List of (language_code, confidence) tuples in input order
+        """
+        return [
+            (doc._.language['language'], doc._.language['score'])
+            for doc in spacy_model.pipe(texts, batch_size=SPACY_BATCH_SIZE)
+        ]
+    
+    def _detect_with_fasttext(self, text: str) -> Tuple[str, float]:
+        """
+        Detect language using the fastText lid.176 model
+        
+        Args:
+            text: Input text to detect
+            
+        Returns:
+            Tuple of (language_code, confidence)
+        """
+        try:
+            # fastText predicts one line at a time
+            labels, probabilities = fasttext_model.predict(text.replace('\n', ' '), k=1)
+            return labels[0].replace('__label__', ''), float(probabilities[0])
+        except Exception as e:
+            logger.warning(f"fastText detection failed: {e}")
+            return "unknown", 0.0
+    
+    def _detect_batch_with_fasttext(self, texts: List[str]) -> List[Tuple[str, float]]:
+        """
+        Detect languages of several texts with a single fastText call
+        
+        Args:
+            texts: Input texts to detect
+            
+        Returns:
+            List of (language_code, confidence) tuples in input order
+        """
+        if not texts:
+            return []
+        labels, probabilities = fasttext_model.predict([text.replace('\n', ' ') for text in texts], k=1)
+        return [
+            (text_labels[0].replace('__label__', ''), float(text_probabilities[0]))
+            for text_labels, text_probabilities in zip(labels, probabilities)
+        ]
+    
     def detect(self, text: str, method: Optional[str] = None, 
               advanced_cleaning: bool = False, remove_punct: bool = True,
               remove_nums: bool = False, remove_special: bool = False) -> Dict:
@@ -141,7 +330,7 @@ class LanguageDetector:
         
         Args:
             text: Input text to detect
-            method: Specific detection method to use (if None, uses all available methods)
+            method: Specific detection method to use (if None, combines the default methods)
             advanced_cleaning: Whether to use advanced text cleaning
             remove_punct: Whether to remove punctuation during cleaning
             remove_nums: Whether to remove numbers during cleaning
@@ -162,45 +351,156 @@ class LanguageDetector:
             }
         
         # Clean the text
-        if advanced_cleaning:
-            cleaned_text = advanced_clean_text(text, remove_punct, remove_nums, remove_special)
-        else:
-            cleaned_text = clean_text(text)
+        cleaned_text = self._clean(text, advanced_cleaning, remove_punct, remove_nums, remove_special)
+        
+        # Detectors only need a prefix of long texts
+        sample = cleaned_text[:MAX_DETECTION_LENGTH]
         
         # If method is specified, use only that method
         if method and method in self.methods:
-            language_code, confidence = self.methods[method](cleaned_text)
+            method_result = self._run_method(method, sample)
+            language_code = method_result['language_code']
             language_name = get_language_name(language_code)
             language_family = get_language_family(language_code)
             english = is_english(language_code)
             
-            return {
+            result = {
                 'text': text,
                 'cleaned_text': cleaned_text,
                 'language_code': language_code,
                 'language': language_name,
                 'language_family': language_family,
                 'is_english': english,
-                'confidence': confidence,
+                'confidence': method_result['confidence'],
                 'method': method
             }
+            if method_result.get('failed'):
+                result['failed'] = True
+            return result
         
-        # Use all available methods and combine results
-        results = {}
-        for method_name, detect_func in self.methods.items():
-            try:
-                language_code, confidence = detect_func(cleaned_text)
-                results[method_name] = {
-                    'language_code': language_code,
-                    'confidence': confidence
-                }
-            except Exception as e:
-                logger.error(f"Error in {method_name} detection: {e}")
-                results[method_name] = {
-                    'language_code': 'unknown',
-                    'confidence': 0.0
-                }
+        # Texts written in a script used by a single language need no detectors
+        script_results = self._detect_by_script(sample)
+        if script_results is not None:
+            return self._combine_results(text, cleaned_text, script_results)
+        
+        # Use the default methods and combine results. The methods are
+        # independent and mostly wait on I/O or C code, so they run concurrently.
+        if len(self.default_methods) > 1:
+            futures = {
+                method_name: self._method_executor.submit(self._run_method, method_name, sample)
+                for method_name in self.default_methods
+            }
+            results = {method_name: future.result() for method_name, future in futures.items()}
+        else:
+            results = {
+                method_name: self._run_method(method_name, sample)
+                for method_name in self.default_methods
+            }
+        
+        return self._combine_results(text, cleaned_text, results)
+    
+    def _clean(self, text: str, advanced_cleaning: bool, remove_punct: bool,
+               remove_nums: bool, remove_special: bool) -> str:
+        """
+        Clean text with basic or advanced cleaning
+        
+        Args:
+            text: Input text to clean
+            advanced_cleaning: Whether to use advanced text cleaning
+            remove_punct: Whether to remove punctuation during advanced cleaning
+            remove_nums: Whether to remove numbers during advanced cleaning
+            remove_special: Whether to remove special characters during advanced cleaning
+            
+        Returns:
+            Cleaned text
+        """
+        if advanced_cleaning:
+            return advanced_clean_text(text, remove_punct, remove_nums, remove_special)
+        return clean_text(text)
+    
+    def _detect_by_script(self, text: str) -> Optional[Dict[str, Dict]]:
+        """
+        Detect language from the Unicode script alone
+        
+        Args:
+            text: Cleaned text to detect
+            
+        Returns:
+            Results dictionary with a single 'script' entry, or None if the
+            script does not identify a single language
+        """
+        detection = detect_script_language(text)
+        if detection is None:
+            return None
+        language_code, confidence = detection
+        return {
+            'script': {
+                'language_code': language_code,
+                'confidence': confidence
+            }
+        }
+    
+    def _run_method(self, method_name: str, text: str) -> Dict:
+        """
+        Run a single detection method, converting failures into an unknown result
+        
+        Args:
+            method_name: Name of the detection method
+            text: Cleaned text to detect
+            
+        Returns:
+            Dictionary with language_code and confidence, plus failed=True if
+            the method raised an error rather than finding no language
+        """
+        try:
+            language_code, confidence = self.methods[method_name](text)
+            return {
+                'language_code': canonical_language_code(language_code),
+                'confidence': confidence
+            }
+        except Exception as e:
+            logger.error(f"Error in {method_name} detection: {e}")
+            return {
+                'language_code': 'unknown',
+                'confidence': 0.0,
+                'failed': True
+            }
+    
+    def _run_batch_method(self, method_name: str, texts: List[str]) -> List[Dict]:
+        """
+        Run a batched detection method, falling back to per-item detection on failure
         
+        Args:
+            method_name: Name of a method registered in batch_methods
+            texts: Cleaned texts to detect
+            
+        Returns:
+            List of dictionaries with language_code and confidence
+        """
+        try:
+            detections = self.batch_methods[method_name](texts)
+            if len(detections) != len(texts):
+                raise ValueError(f"expected {len(texts)} results, got {len(detections)}")
+            return [
+                {'language_code': canonical_language_code(language_code), 'confidence': confidence}
+                for language_code, confidence in detections
+            ]
+        except Exception as e:
+            logger.warning(f"Batched {method_name} detection failed, falling back to per-item: {e}")
+            return [self._run_method(method_name, text) for text in texts]
+    
+    def _combine_results(self, text: str, cleaned_text: str, results: Dict[str, Dict]) -> Dict:
+        """
+        Combine per-method results into a single detection result
+        
+        Args:
+            text: Original input text
+            cleaned_text: Text after cleaning
+            results: Dictionary of detection results keyed by method name
+            
+        Returns:
+            Dictionary with detection results
+        """
         # Calculate weighted confidence and determine best language
         language_code, confidence = calculate_weighted_confidence(results)
         
@@ -209,15 +509,8 @@ class LanguageDetector:
         language_family = get_language_family(language_code)
         english = is_english(language_code)
         
-        # Determine which method contributed most to the result
-        method_counts = {}
-        for method_result in results.values():
-            lang = method_result['language_code']
-            if lang == language_code:
-                method_name = next((m for m, r in results.items() if r['language_code'] == lang), 'combined')
-                method_counts[method_name] = method_counts.get(method_name, 0) + 1
-        
-        best_method = max(method_counts.items(), key=lambda x: x[1])[0] if method_counts else 'combined'
+        # Credit the first method that agrees with the combined result
+        best_method = next((m for m, r in results.items() if r['language_code'] == language_code), 'combined')
         
         return {
             'text': text,
@@ -231,14 +524,239 @@ class LanguageDetector:
             'all_results': results
         }
     
-    def detect_batch(self, texts: List[str]) -> List[Dict]:
+    def detect_batch(self, texts: List[str], workers: int = 8, method: Optional[str] = None,
+                     advanced_cleaning: bool = False, remove_punct: bool = True,
+                     remove_nums: bool = False, remove_special: bool = False) -> List[Dict]:
         """
         Detect language for a batch of texts
         
+        Methods with a batched implementation detect all texts in a single
+        call; the remaining methods run per text on a thread pool so that
+        network-bound requests overlap. Results keep the input order.
+        
         Args:
             texts: List of input texts to detect
+            workers: Number of worker threads; all calls share one thread
+                pool, which grows to the largest value requested
+            method: Specific detection method to use (if None, combines the default methods)
+            advanced_cleaning: Whether to use advanced text cleaning
+            remove_punct: Whether to remove punctuation during cleaning
+            remove_nums: Whether to remove numbers during cleaning
+            remove_special: Whether to remove special characters during cleaning
             
         Returns:
             List of dictionaries with detection results
         """
-        return [self.detect(text) for text in texts]
+        if method and method in self.methods:
+            detect = partial(self.detect, method=method, advanced_cleaning=advanced_cleaning,
+                             remove_punct=remove_punct, remove_nums=remove_nums,
+                             remove_special=remove_special)
+            return list(self._get_batch_executor(workers).map(detect, texts))
+        
+        detections = [None] * len(texts)
+        pending = []
+        cleaned_texts = []
+        samples = []
+        for index, text in enumerate(texts):
+            # Empty texts are answered directly by detect()
+            if not text or not text.strip():
+                continue
+            
+            cleaned_text = self._clean(text, advanced_cleaning, remove_punct, remove_nums, remove_special)
+            sample = cleaned_text[:MAX_DETECTION_LENGTH]
+            script_results = self._detect_by_script(sample)
+            if script_results is not None:
+                detections[index] = self._combine_results(text, cleaned_text, script_results)
+            else:
+                pending.append(index)
+                cleaned_texts.append(cleaned_text)
+                samples.append(sample)
+        
+        executor = self._get_batch_executor(workers)
+        batch_futures = {}
+        item_futures = {}
+        for method_name in self.default_methods:
+            if method_name in self.batch_methods:
+                batch_futures[method_name] = executor.submit(
+                    self._run_batch_method, method_name, samples)
+            else:
+                item_futures[method_name] = [
+                    executor.submit(self._run_method, method_name, sample)
+                    for sample in samples
+                ]
+        
+        method_results = {name: future.result() for name, future in batch_futures.items()}
+        for name, futures in item_futures.items():
+            method_results[name] = [future.result() for future in futures]
+        
+        for position, index in enumerate(pending):
+            results = {name: method_results[name][position] for name in self.default_methods}
+            detections[index] = self._combine_results(texts[index], cleaned_texts[position], results)
+        
+        for index, detection in enumerate(detections):
+            if detection is None:
+                detections[index] = self.detect(texts[index])
+        
+        return detections
+    
+    def _get_batch_executor(self, workers: int) -> ThreadPoolExecutor:
+        """
+        Return the detect_batch thread pool, replacing it if it has fewer than workers threads
+        
+        A replaced pool is not shut down, as calls still submitting to it
+        would fail; its idle threads exit once the last of those calls drops
+        its reference to it.
+        
+        Args:
+            workers: Number of worker threads needed
+            
+        Returns:
+            Thread pool shared by all detect_batch calls
+        """
+        with self._batch_executor_lock:
+            if workers > self._batch_workers:
+                self._batch_executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='detect-batch')
+                self._batch_workers = workers
+            return self._batch_executor
+    
+    async def detect_async(self, text: str, method: Optional[str] = None,
+                           advanced_cleaning: bool = False, remove_punct: bool = True,
+                           remove_nums: bool = False, remove_special: bool = False) -> Dict:
+        """
+        Detect language of input text, batching concurrent calls together
+        
+        Calls made while a batch is being collected are detected with a
+        single detect_batch call; see DetectBatchQueue.
+        
+        Args:
+            text: Input text to detect
+            method: Specific detection method to use (if None, combines the default methods)
+            advanced_cleaning: Whether to use advanced text cleaning
+            remove_punct: Whether to remove punctuation during cleaning
+            remove_nums: Whether to remove numbers during cleaning
+            remove_special: Whether to remove special characters during cleaning
+            
+        Returns:
+            Dictionary with detection results
+        """
+        loop = asyncio.get_running_loop()
+        if self._batch_queue is None or self._batch_queue.loop is not loop:
+            self._batch_queue = DetectBatchQueue(self)
+        return await self._batch_queue.detect(
+            text, method=method, advanced_cleaning=advanced_cleaning,
+            remove_punct=remove_punct, remove_nums=remove_nums,
+            remove_special=remove_special)
+    
+    def warmup(self, text: str = 'hello world') -> None:
+        """
+        Run each default detection method once so lazily loaded models are
+        in memory before the first real detection
+        
+        The methods run on the calling thread rather than the method executor,
+        so no executor threads exist yet if the process forks afterwards
+        (e.g. gunicorn --preload).
+        
+        Args:
+            text: Text to detect
+        """
+        for method_name in self.default_methods:
+            self._run_method(method_name, text)
+
+
+class DetectBatchQueue:
+    """
+    Asyncio queue that groups concurrent detection requests into batches
+    
+    A batch is flushed once batch_size requests are waiting or max_wait_ms
+    milliseconds have passed since its first request arrived. Each batch is
+    detected with LanguageDetector.detect_batch in the default executor, one
+    call per distinct set of detection options.
+    """
+    
+    def __init__(self, detector: LanguageDetector, batch_size: int = 32, max_wait_ms: float = 25):
+        """
+        Initialize the queue; must be called from a running event loop
+        
+        Args:
+            detector: Language detector used to process batches
+            batch_size: Maximum number of requests per batch
+            max_wait_ms: Maximum time to wait for a batch to fill up
+        """
+        self.detector = detector
+        self.batch_size = batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        self._worker = None
+        # Strong references to running flush tasks so they are not garbage collected
+        self._flushes = set()
+    
+    async def detect(self, text: str, **options) -> Dict:
+        """
+        Queue a text for detection and wait for its result
+        
+        Args:
+            text: Input text to detect
+            **options: Keyword arguments accepted by LanguageDetector.detect_batch
+            
+        Returns:
+            Dictionary with detection results
+        """
+        if self._worker is None or self._worker.done():
+            self._worker = self.loop.create_task(self._run())
+        
+        future = self.loop.create_future()
+        await self._queue.put((text, tuple(sorted(options.items())), future))
+        return await future
+    
+    def close(self):
+        """Stop collecting batches; requests already being detected still complete"""
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+    
+    async def _run(self):
+        """Collect requests into batches and dispatch them"""
+        while True:
+            batch = [await self._queue.get()]
+            deadline = self.loop.time() + self.max_wait
+            while len(batch) < self.batch_size:
+                timeout = deadline - self.loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            # Keep collecting the next batch while this one is detected
+            flush = self.loop.create_task(self._flush(batch))
+            self._flushes.add(flush)
+            flush.add_done_callback(self._flushes.discard)
+    
+    async def _flush(self, batch: List[Tuple]):
+        """
+        Detect a batch of queued requests and resolve their futures
+        
+        Args:
+            batch: List of (text, options, future) tuples
+        """
+        groups = {}
+        for text, options, future in batch:
+            groups.setdefault(options, []).append((text, future))
+        
+        for options, items in groups.items():
+            texts = [text for text, _ in items]
+            try:
+                detections = await self.loop.run_in_executor(
+                    None, partial(self.detector.detect_batch, texts, **dict(options)))
+            except Exception as e:
+                logger.error(f"Batched detection failed: {e}")
+                for _, future in items:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            
+            for (_, future), detection in zip(items, detections):
+                if not future.done():
+                    future.set_result(detection)
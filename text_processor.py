@@ -4,8 +4,146 @@ Enhanced text processing module for language detection
 import re
 import string
 import unicodedata
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, List, Tuple, Union, Optional
 
+from .utils import CLEAN_CACHE_MAX_LENGTH
+
+# Patterns used by the cleaning functions, compiled once at import
+_URL_PATTERN = r'https?://\S+|www\.\S+'
+_EMAIL_PATTERN = r'\S+@\S+'
+_HTML_PATTERN = r'<.*?>'
+_NUM_PATTERN = r'\d+'
+_SPECIAL_PATTERN = r'[^a-zA-Z0-9\s]'
+
+_URL_RE = re.compile(_URL_PATTERN)
+_EMAIL_RE = re.compile(_EMAIL_PATTERN)
+_WS_RE = re.compile(r'\s+')
+_NUM_RE = re.compile(_NUM_PATTERN)
+_SPECIAL_RE = re.compile(_SPECIAL_PATTERN)
+
+# HTML tags and, optionally, digits and special characters, fused into one
+# alternation per (remove_nums, remove_special) combination. URLs and email
+# addresses are removed by their own passes first: as alternatives of the
+# same pattern, an email match starting earlier in a token would swallow a
+# URL together with the text before it, and a tag spanning whitespace could
+# swallow an email address. Tags are tried first, so they still win over the
+# digits and special characters they contain.
+_DELETE_RES = {
+    (remove_nums, remove_special): re.compile('|'.join(
+        [_HTML_PATTERN]
+        + ([_NUM_PATTERN] if remove_nums else [])
+        + ([_SPECIAL_PATTERN] if remove_special else [])
+    ))
+    for remove_nums in (False, True)
+    for remove_special in (False, True)
+}
+
+# Translation tables deleting punctuation and/or ASCII digits, keyed by
+# (remove_punct, remove_nums)
+_PUNCT_TABLE = str.maketrans('', '', string.punctuation)
+_NUMS_TABLE = str.maketrans('', '', string.digits)
+_DELETE_TABLES = {
+    (False, False): None,
+    (True, False): _PUNCT_TABLE,
+    (False, True): _NUMS_TABLE,
+    (True, True): {**_PUNCT_TABLE, **_NUMS_TABLE},
+}
+
+# Weights for each detection method (can be adjusted based on performance)
+METHOD_WEIGHTS = {
+    'langdetect': 0.3,
+    'textblob': 0.2,
+    'googletrans': 0.3,
+    'spacy': 0.4,
+    'fasttext': 0.4
+}
+
+# Weight for methods missing from METHOD_WEIGHTS
+DEFAULT_METHOD_WEIGHT = 0.1
+
+# Unicode ranges of scripts that are written by essentially one language
+# in the supported set. Range boundaries are multiples of 16, so the ranges
+# can be flattened into a lookup keyed by codepoint >> 4.
+_SCRIPT_RANGES = (
+    (0x0370, 0x03FF, 'el'),  # Greek and Coptic
+    (0x1F00, 0x1FFF, 'el'),  # Greek Extended
+    (0x0590, 0x05FF, 'he'),  # Hebrew
+    (0x0980, 0x09FF, 'bn'),  # Bengali
+    (0x0A00, 0x0A7F, 'pa'),  # Gurmukhi
+    (0x0A80, 0x0AFF, 'gu'),  # Gujarati
+    (0x0B80, 0x0BFF, 'ta'),  # Tamil
+    (0x0C00, 0x0C7F, 'te'),  # Telugu
+    (0x0C80, 0x0CFF, 'kn'),  # Kannada
+    (0x0D00, 0x0D7F, 'ml'),  # Malayalam
+    (0x0E00, 0x0E7F, 'th'),  # Thai
+    (0x1100, 0x11FF, 'ko'),  # Hangul Jamo
+    (0x3130, 0x318F, 'ko'),  # Hangul Compatibility Jamo
+    (0xAC00, 0xD7AF, 'ko'),  # Hangul Syllables
+    (0x3040, 0x309F, 'ja'),  # Hiragana
+    (0x30A0, 0x30FF, 'ja'),  # Katakana
+)
+_SCRIPT_BLOCKS = {
+    block: lang
+    for start, end, lang in _SCRIPT_RANGES
+    for block in range(start >> 4, (end >> 4) + 1)
+}
+
+# Number of codepoints inspected by detect_script_language
+SCRIPT_SAMPLE_SIZE = 64
+
+# Share of sampled letters that must belong to one script
+SCRIPT_THRESHOLD = 0.9
+
+# Confidence reported for script-based detections
+SCRIPT_CONFIDENCE = 0.99
+
+# Language family names keyed by base ISO language code
+LANGUAGE_FAMILIES = MappingProxyType({
+    # Germanic languages
+    'en': 'Germanic',
+    'de': 'Germanic',
+    'nl': 'Germanic',
+    'sv': 'Germanic',
+    'no': 'Germanic',
+    'da': 'Germanic',
+    
+    # Romance languages
+    'es': 'Romance',
+    'fr': 'Romance',
+    'it': 'Romance',
+    'pt': 'Romance',
+    'ro': 'Romance',
+    
+    # Slavic languages
+    'ru': 'Slavic',
+    'uk': 'Slavic',
+    'pl': 'Slavic',
+    'cs': 'Slavic',
+    'bg': 'Slavic',
+    
+    # Indo-Aryan languages
+    'hi': 'Indo-Aryan',
+    'bn': 'Indo-Aryan',
+    'pa': 'Indo-Aryan',
+    'gu': 'Indo-Aryan',
+    
+    # East Asian languages
+    'zh': 'Sino-Tibetan',
+    'ja': 'Japonic',
+    'ko': 'Koreanic',
+    
+    # Other language families
+    'ar': 'Semitic',
+    'he': 'Semitic',
+    'fi': 'Uralic',
+    'hu': 'Uralic',
+    'tr': 'Turkic',
+    'th': 'Tai-Kadai',
+    'vi': 'Austroasiatic',
+})
+
 def normalize_text(text: str) -> str:
     """
     Normalize Unicode text by converting to NFKC form
@@ -19,6 +157,10 @@ def normalize_text(text: str) -> str:
     if not text:
         return ""
     
+    # NFKC leaves ASCII unchanged, and str.isascii() is a constant-time flag check
+    if text.isascii():
+        return text
+    
     # Normalize Unicode characters
     return unicodedata.normalize('NFKC', text)
 
@@ -35,9 +177,7 @@ def remove_punctuation(text: str) -> str:
     if not text:
         return ""
     
-    # Create a translation table to remove punctuation
-    translator = str.maketrans('', '', string.punctuation)
-    return text.translate(translator)
+    return text.translate(_PUNCT_TABLE)
 
 def remove_numbers(text: str) -> str:
     """
@@ -52,7 +192,7 @@ def remove_numbers(text: str) -> str:
     if not text:
         return ""
     
-    return re.sub(r'\d+', '', text)
+    return _NUM_RE.sub('', text)
 
 def remove_special_characters(text: str) -> str:
     """
@@ -68,7 +208,7 @@ def remove_special_characters(text: str) -> str:
         return ""
     
     # Keep only letters, numbers, and whitespace
-    return re.sub(r'[^a-zA-Z0-9\s]', '', text)
+    return _SPECIAL_RE.sub('', text)
 
 def advanced_clean_text(text: str, remove_punct: bool = True, 
                        remove_nums: bool = False, 
@@ -76,6 +216,8 @@ def advanced_clean_text(text: str, remove_punct: bool = True,
     """
     Advanced text cleaning with configurable options
     
+    Short inputs are served from an LRU cache keyed on the text and options.
+    
     Args:
         text: Input text to clean
         remove_punct: Whether to remove punctuation
@@ -88,36 +230,94 @@ def advanced_clean_text(text: str, remove_punct: bool = True,
     if not text:
         return ""
     
-    # Normalize Unicode characters
-    text = normalize_text(text)
-    
-    # Remove URLs
-    text = re.sub(r'https?://\S+|www\.\S+', '', text)
+    flags = (bool(remove_punct), bool(remove_nums), bool(remove_special))
+    if len(text) > CLEAN_CACHE_MAX_LENGTH:
+        return _advanced_clean_text(text, flags)
+    return _advanced_clean_text_cached(text, flags)
+
+def _advanced_clean_text(text: str, flags: Tuple[bool, bool, bool]) -> str:
+    """
+    Clean text according to a (remove_punct, remove_nums, remove_special) tuple
     
-    # Remove email addresses
-    text = re.sub(r'\S+@\S+', '', text)
+    Args:
+        text: Input text to clean
+        flags: Tuple of cleaning options
+        
+    Returns:
+        Cleaned text
+    """
+    remove_punct, remove_nums, remove_special = flags
     
-    # Remove HTML tags
-    text = re.sub(r'<.*?>', '', text)
+    # Normalize Unicode characters
+    text = normalize_text(text)
     
-    # Optional processing
-    if remove_punct:
-        text = remove_punctuation(text)
+    # \d only matches ASCII digits in ASCII text, so there digits can be
+    # deleted by the same str.translate pass as punctuation
+    if text.isascii():
+        delete_re = _DELETE_RES[(False, remove_special)]
+        delete_table = _DELETE_TABLES[(remove_punct, remove_nums)]
+    else:
+        delete_re = _DELETE_RES[(remove_nums, remove_special)]
+        delete_table = _DELETE_TABLES[(remove_punct, False)]
     
-    if remove_nums:
-        text = remove_numbers(text)
+    # Remove URLs and email addresses, then HTML tags and, optionally,
+    # numbers and special characters in a single pass
+    text = _URL_RE.sub('', text)
+    text = _EMAIL_RE.sub('', text)
+    text = delete_re.sub('', text)
     
-    if remove_special:
-        text = remove_special_characters(text)
+    if delete_table is not None:
+        text = text.translate(delete_table)
     
     # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = _WS_RE.sub(' ', text)
     
     # Strip leading/trailing whitespace
     text = text.strip()
     
     return text
 
+_advanced_clean_text_cached = lru_cache(maxsize=4096)(_advanced_clean_text)
+
+def detect_script_language(text: str) -> Optional[Tuple[str, float]]:
+    """
+    Detect language from the Unicode script of the text, when unambiguous
+    
+    Inspects up to SCRIPT_SAMPLE_SIZE evenly spaced codepoints. Scripts shared
+    by several languages (Latin, Cyrillic, Arabic, Devanagari, Han) are never
+    matched, so such texts always return None.
+    
+    Args:
+        text: Input text
+        
+    Returns:
+        Tuple of (language_code, confidence), or None if the script does
+        not identify a single language
+    """
+    if not text:
+        return None
+    
+    # Round the step up so that at most SCRIPT_SAMPLE_SIZE codepoints are read
+    step = -(-len(text) // SCRIPT_SAMPLE_SIZE)
+    letters = 0
+    counts = {}
+    for char in text[::step]:
+        if not char.isalpha():
+            continue
+        letters += 1
+        lang = _SCRIPT_BLOCKS.get(ord(char) >> 4)
+        if lang is not None:
+            counts[lang] = counts.get(lang, 0) + 1
+    
+    if not counts:
+        return None
+    
+    lang = max(counts, key=counts.__getitem__)
+    if counts[lang] < SCRIPT_THRESHOLD * letters:
+        return None
+    
+    return lang, SCRIPT_CONFIDENCE
+
 def calculate_weighted_confidence(results: Dict[str, Dict]) -> Tuple[str, float]:
     """
     Calculate weighted confidence score from multiple detection methods
@@ -131,16 +331,10 @@ def calculate_weighted_confidence(results: Dict[str, Dict]) -> Tuple[str, float]
     if not results:
         return "unknown", 0.0
     
-    # Define weights for each method (can be adjusted based on performance)
-    method_weights = {
-        'langdetect': 0.3,
-        'textblob': 0.2,
-        'googletrans': 0.3,
-        'spacy': 0.4
-    }
-    
-    # Count language occurrences and weighted confidence
+    # Per-language [count, weighted confidence] pairs, accumulated in a
+    # single pass together with the normalizing total weight
     language_scores = {}
+    total_weight = 0.0
     
     for method, result in results.items():
         lang = result.get('language_code', 'unknown')
@@ -150,29 +344,22 @@ def calculate_weighted_confidence(results: Dict[str, Dict]) -> Tuple[str, float]
         if conf is None:
             conf = 0.0
             
-        weight = method_weights.get(method, 0.1)
-        
-        if lang not in language_scores:
-            language_scores[lang] = {
-                'count': 0,
-                'weighted_conf': 0.0
-            }
-        
-        language_scores[lang]['count'] += 1
-        language_scores[lang]['weighted_conf'] += conf * weight
-    
-    # Find language with highest weighted confidence
-    if not language_scores:
-        return "unknown", 0.0
+        weight = METHOD_WEIGHTS.get(method, DEFAULT_METHOD_WEIGHT)
+        total_weight += weight
         
-    best_lang = max(language_scores.items(), 
-                   key=lambda x: (x[1]['count'], x[1]['weighted_conf']))
+        scores = language_scores.get(lang)
+        if scores is None:
+            language_scores[lang] = [1, conf * weight]
+        else:
+            scores[0] += 1
+            scores[1] += conf * weight
     
-    lang_code = best_lang[0]
+    # Most votes wins, ties broken by weighted confidence; the score lists
+    # compare lexicographically, so no Python-level key function is needed
+    lang_code = max(language_scores, key=language_scores.__getitem__)
     
     # Normalize confidence to 0-1 range
-    total_weight = sum(method_weights.get(m, 0.1) for m in results.keys())
-    confidence = best_lang[1]['weighted_conf'] / total_weight if total_weight > 0 else 0.0
+    confidence = language_scores[lang_code][1] / total_weight if total_weight > 0 else 0.0
     
     return lang_code, min(confidence, 1.0)
 
@@ -186,48 +373,5 @@ def get_language_family(language_code: str) -> str:
     Returns:
         Language family name
     """
-    language_families = {
-        # Germanic languages
-        'en': 'Germanic',
-        'de': 'Germanic',
-        'nl': 'Germanic',
-        'sv': 'Germanic',
-        'no': 'Germanic',
-        'da': 'Germanic',
-        
-        # Romance languages
-        'es': 'Romance',
-        'fr': 'Romance',
-        'it': 'Romance',
-        'pt': 'Romance',
-        'ro': 'Romance',
-        
-        # Slavic languages
-        'ru': 'Slavic',
-        'uk': 'Slavic',
-        'pl': 'Slavic',
-        'cs': 'Slavic',
-        'bg': 'Slavic',
-        
-        # Indo-Aryan languages
-        'hi': 'Indo-Aryan',
-        'bn': 'Indo-Aryan',
-        'pa': 'Indo-Aryan',
-        'gu': 'Indo-Aryan',
-        
-        # East Asian languages
-        'zh': 'Sino-Tibetan',
-        'ja': 'Japonic',
-        'ko': 'Koreanic',
-        
-        # Other language families
-        'ar': 'Semitic',
-        'he': 'Semitic',
-        'fi': 'Uralic',
-        'hu': 'Uralic',
-        'tr': 'Turkic',
-        'th': 'Tai-Kadai',
-        'vi': 'Austroasiatic',
-    }
-    
-    return language_families.get(language_code.lower().split('-')[0], 'Other')
+    # Look up the base code, e.g. 'zh' for 'zh-cn'
+    return LANGUAGE_FAMILIES.get(language_code.partition('-')[0].lower(), 'Other')
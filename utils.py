@@ -2,13 +2,85 @@
 Language detection utility functions
 """
 import re
+import sys
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, List, Tuple, Union
 
+# Longer texts are cleaned without being cached to keep cache memory bounded
+CLEAN_CACHE_MAX_LENGTH = 2048
+
+_URL_RE = re.compile(r'https?://\S+|www\.\S+')
+_EMAIL_RE = re.compile(r'\S+@\S+')
+_WS_RE = re.compile(r'\s+')
+
+# Full language names keyed by ISO language code
+LANGUAGE_NAMES = MappingProxyType({
+    'af': 'Afrikaans',
+    'ar': 'Arabic',
+    'bg': 'Bulgarian',
+    'bn': 'Bengali',
+    'ca': 'Catalan',
+    'cs': 'Czech',
+    'cy': 'Welsh',
+    'da': 'Danish',
+    'de': 'German',
+    'el': 'Greek',
+    'en': 'English',
+    'es': 'Spanish',
+    'et': 'Estonian',
+    'fa': 'Persian',
+    'fi': 'Finnish',
+    'fr': 'French',
+    'gu': 'Gujarati',
+    'he': 'Hebrew',
+    'hi': 'Hindi',
+    'hr': 'Croatian',
+    'hu': 'Hungarian',
+    'id': 'Indonesian',
+    'it': 'Italian',
+    'ja': 'Japanese',
+    'kn': 'Kannada',
+    'ko': 'Korean',
+    'lt': 'Lithuanian',
+    'lv': 'Latvian',
+    'mk': 'Macedonian',
+    'ml': 'Malayalam',
+    'mr': 'Marathi',
+    'ne': 'Nepali',
+    'nl': 'Dutch',
+    'no': 'Norwegian',
+    'pa': 'Punjabi',
+    'pl': 'Polish',
+    'pt': 'Portuguese',
+    'ro': 'Romanian',
+    'ru': 'Russian',
+    'sk': 'Slovak',
+    'sl': 'Slovenian',
+    'so': 'Somali',
+    'sq': 'Albanian',
+    'sv': 'Swedish',
+    'sw': 'Swahili',
+    'ta': 'Tamil',
+    'te': 'Telugu',
+    'th': 'Thai',
+    'tl': 'Tagalog',
+    'tr': 'Turkish',
+    'uk': 'Ukrainian',
+    'ur': 'Urdu',
+    'vi': 'Vietnamese',
+    'zh-cn': 'Chinese (Simplified)',
+    'zh-tw': 'Chinese (Traditional)',
+    'zh': 'Chinese',
+})
+
 
 def clean_text(text: str) -> str:
     """
     Clean text by removing extra whitespace and special characters
     
+    Results for short texts are memoized, so repeated inputs are cleaned only once.
+    
     Args:
         text: Input text to clean
         
@@ -18,14 +90,29 @@ def clean_text(text: str) -> str:
     if not text:
         return ""
     
+    if len(text) > CLEAN_CACHE_MAX_LENGTH:
+        return _clean_text(text)
+    return _clean_text_cached(text)
+
+
+def _clean_text(text: str) -> str:
+    """
+    Remove URLs, email addresses and extra whitespace from non-empty text
+    
+    Args:
+        text: Input text to clean
+        
+    Returns:
+        Cleaned text
+    """
     # Remove URLs
-    text = re.sub(r'https?://\S+|www\.\S+', '', text)
+    text = _URL_RE.sub('', text)
     
     # Remove email addresses
-    text = re.sub(r'\S+@\S+', '', text)
+    text = _EMAIL_RE.sub('', text)
     
     # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = _WS_RE.sub(' ', text)
     
     # Strip leading/trailing whitespace
     text = text.strip()
@@ -33,6 +120,9 @@ def clean_text(text: str) -> str:
     return text
 
 
+_clean_text_cached = lru_cache(maxsize=4096)(_clean_text)
+
+
 def format_confidence(confidence: float) -> str:
     """
     Format confidence score as percentage
@@ -46,6 +136,26 @@ def format_confidence(confidence: float) -> str:
     return f"{confidence * 100:.2f}%"
 
 
+def canonical_language_code(language_code: str) -> str:
+    """
+    Canonicalize a language code returned by a detection backend
+    
+    Codes are lowercased, so that e.g. 'zh-CN' and 'zh-cn' count as the same
+    language, and interned, so that comparing and hashing them downstream
+    hits the identity fast path.
+    
+    Args:
+        language_code: ISO language code as returned by a detector
+        
+    Returns:
+        Lowercase, interned language code
+    """
+    if not language_code:
+        return 'unknown'
+    
+    return sys.intern(language_code.lower())
+
+
 def get_language_name(language_code: str) -> str:
     """
     Get full language name from ISO language code
@@ -56,70 +166,13 @@ def get_language_name(language_code: str) -> str:
     Returns:
         Full language name
     """
-    language_map = {
-        'af': 'Afrikaans',
-        'ar': 'Arabic',
-        'bg': 'Bulgarian',
-        'bn': 'Bengali',
-        'ca': 'Catalan',
-        'cs': 'Czech',
-        'cy': 'Welsh',
-        'da': 'Danish',
-        'de': 'German',
-        'el': 'Greek',
-        'en': 'English',
-        'es': 'Spanish',
-        'et': 'Estonian',
-        'fa': 'Persian',
-        'fi': 'Finnish',
-        'fr': 'French',
-        'gu': 'Gujarati',
-        'he': 'Hebrew',
-        'hi': 'Hindi',
-        'hr': 'Croatian',
-        'hu': 'Hungarian',
-        'id': 'Indonesian',
-        'it': 'Italian',
-        'ja': 'Japanese',
-        'kn': 'Kannada',
-        'ko': 'Korean',
-        'lt': 'Lithuanian',
-        'lv': 'Latvian',
-        'mk': 'Macedonian',
-        'ml': 'Malayalam',
-        'mr': 'Marathi',
-        'ne': 'Nepali',
-        'nl': 'Dutch',
-        'no': 'Norwegian',
-        'pa': 'Punjabi',
-        'pl': 'Polish',
-        'pt': 'Portuguese',
-        'ro': 'Romanian',
-        'ru': 'Russian',
-        'sk': 'Slovak',
-        'sl': 'Slovenian',
-        'so': 'Somali',
-        'sq': 'Albanian',
-        'sv': 'Swedish',
-        'sw': 'Swahili',
-        'ta': 'Tamil',
-        'te': 'Telugu',
-        'th': 'Thai',
-        'tl': 'Tagalog',
-        'tr': 'Turkish',
-        'uk': 'Ukrainian',
-        'ur': 'Urdu',
-        'vi': 'Vietnamese',
-        'zh-cn': 'Chinese (Simplified)',
-        'zh-tw': 'Chinese (Traditional)',
-        'zh': 'Chinese',
-    }
+    code = language_code.lower()
     
     # Handle special case for Chinese variants
-    if language_code.lower() in ['zh-cn', 'zh-tw', 'zh']:
+    if code in ('zh-cn', 'zh-tw', 'zh'):
         return 'Chinese'
     
-    return language_map.get(language_code.lower(), f"Unknown ({language_code})")
+    return LANGUAGE_NAMES.get(code, f"Unknown ({language_code})")
 
 
 def is_english(language_code: str) -> bool:
@@ -2,58 +2,352 @@
 Web-based user interface for language detection tool
 """
 import os
-import sys
-import json
 import argparse
-from flask import Flask, request, render_template, jsonify
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, fields
+from operator import itemgetter
+from typing import Optional
+import orjson
+from flask import Flask, Response, request
+from flask_compress import Compress
 
-# Add parent directory to path to import from src
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from src.detector import LanguageDetector
-from src.utils import format_confidence
+from .utils import format_confidence
 
 # Initialize Flask app
 app = Flask(__name__)
 
-# Initialize language detector
-detector = LanguageDetector()
+# Compress the page and larger JSON responses for clients that accept it
+app.config['COMPRESS_MIMETYPES'] = ['text/html', 'application/json']
+app.config['COMPRESS_LEVEL'] = 6
+app.config['COMPRESS_MIN_SIZE'] = 500
+compress = Compress(app)
+
+# The main page is static, so it is read once and served from memory
+with open(os.path.join(app.static_folder, 'index.html'), 'rb') as f:
+    _INDEX_HTML = f.read()
+_INDEX_ETAG = hashlib.blake2b(_INDEX_HTML, digest_size=16).hexdigest()
+
+# Language detector, created on first use by _get_detector() so that importing
+# this module does not load the detection backends
+detector = None
+_detector_lock = threading.Lock()
+
+# Cache-Control of /detect responses, including 304 revalidations
+DETECT_CACHE_CONTROL = 'private, max-age=60'
+
+# Maximum number of detection results kept in the result cache
+RESULT_CACHE_SIZE = 4096
+
+# Only results for texts up to this length are cached. Each cached result
+# holds the text and its cleaned form, so this bounds the cache's memory.
+CACHE_MAX_TEXT_LENGTH = 256
+
+# Longer texts are truncated before detection; the detectors only look at
+# a prefix of the cleaned text, and cleaning time grows with the length
+MAX_TEXT_LENGTH = 10000
+
+# Maximum number of texts accepted by /detect_batch
+MAX_BATCH_SIZE = 1000
+
+# Size of the detector thread pool shared by /detect_batch requests
+MAX_BATCH_WORKERS = 32
+
+# Error messages returned to clients are cut to this many characters; the
+# full exception is logged
+MAX_ERROR_LENGTH = 1024
+
+# LRU cache of formatted detection results keyed by text and options
+_result_cache = OrderedDict()
+_result_cache_lock = threading.Lock()
+
+@dataclass(frozen=True)
+class DetectOptions:
+    """Validated detection options of a /detect or /detect_batch request"""
+    method: Optional[str] = None
+    advanced_cleaning: bool = False
+    remove_punct: bool = True
+    remove_nums: bool = False
+    remove_special: bool = False
+    
+    def __post_init__(self):
+        if self.method is not None and not isinstance(self.method, str):
+            raise ValueError('method must be a string')
+        for name in _BOOL_OPTIONS:
+            if not isinstance(getattr(self, name), bool):
+                raise ValueError(f'{name} must be a boolean')
+
+_OPTION_DEFAULTS = {field.name: field.default for field in fields(DetectOptions)}
+_OPTION_NAMES = frozenset(_OPTION_DEFAULTS)
+_BOOL_OPTIONS = tuple(sorted(_OPTION_NAMES - {'method'}))
+
+# Reads all option values, in DetectOptions field order, in a single call
+_get_option_values = itemgetter(*_OPTION_DEFAULTS)
+
+# Clients mostly repeat a handful of option combinations, so one shared
+# DetectOptions instance is kept per combination. Result-cache keys built
+# from it then compare by identity instead of field by field. Only options
+# whose method the detector provides are pooled, which keeps the pool small.
+_options_pool = {}
+
+def _parse_payload(body, field):
+    """
+    Parse a request body into one required field and the detection options
+    
+    Args:
+        body: Raw request body
+        field: Name of the required field ('text' or 'texts')
+        
+    Returns:
+        Tuple of (field value, DetectOptions)
+        
+    Raises:
+        ValueError: If the body is malformed, with a message for the client
+    """
+    try:
+        data = orjson.loads(body or b'{}')
+    except orjson.JSONDecodeError:
+        raise ValueError('Invalid JSON')
+    
+    if not isinstance(data, dict) or field not in data:
+        raise ValueError(f'No {field} provided')
+    
+    value = data.pop(field)
+    unknown = data.keys() - _OPTION_NAMES
+    if unknown:
+        raise ValueError(f"Unknown options: {', '.join(sorted(unknown))}")
+    
+    return value, DetectOptions(*_get_option_values({**_OPTION_DEFAULTS, **data}))
+
+def _pooled_options(options):
+    """
+    Return the shared DetectOptions instance equal to options
+    
+    Args:
+        options: DetectOptions whose method has been checked by _unknown_method
+        
+    Returns:
+        Pooled DetectOptions
+    """
+    pooled = _options_pool.get(options)
+    if pooled is None:
+        pooled = _options_pool.setdefault(options, options)
+    return pooled
+
+def _get_detector():
+    """Return the shared language detector, creating it on first use"""
+    global detector
+    current = detector
+    if current is None:
+        with _detector_lock:
+            current = detector
+            if current is None:
+                # Importing the detector module loads spaCy, langdetect, etc.
+                from .detector import LanguageDetector
+                current = detector = LanguageDetector()
+    return current
+
+# Detection backends may hand back numpy scalars/arrays or non-string dict keys.
+# Keys are sorted so that equal results serialize to the same bytes whichever
+# detector code path (and dict insertion order) produced them.
+_JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS
+
+def _json_default(obj):
+    """Serialize scalar types orjson does not know natively (e.g. numpy.float32)"""
+    if hasattr(obj, 'item'):
+        return obj.item()
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+def _json(payload, status=200):
+    """Build a JSON response, serialized with orjson"""
+    body = orjson.dumps(payload, default=_json_default, option=_JSON_OPTIONS)
+    return app.response_class(body, status=status, mimetype='application/json')
+
+def _not_modified(etag, match_any=False):
+    """
+    Build a 304 response if the client already holds the response tagged etag
+    
+    Flask-Compress appends the content encoding to the ETag of compressed
+    responses ("<etag>:gzip"), so those variants are accepted as well. The
+    304 repeats whichever variant the client sent.
+    
+    Args:
+        etag: ETag of the uncompressed response
+        match_any: Whether "If-None-Match: *" also counts as a match
+        
+    Returns:
+        304 response, or None if the response has to be sent
+    """
+    if_none_match = request.if_none_match
+    candidates = [etag] + [f'{etag}:{algorithm}' for algorithm in compress.enabled_algorithms]
+    matched = next((tag for tag in candidates if if_none_match.is_strong(tag)), None)
+    if matched is None and match_any and if_none_match.star_tag:
+        matched = etag
+    if matched is None:
+        return None
+    
+    response = Response(status=304)
+    response.set_etag(matched)
+    return response
+
+def _unknown_method(options):
+    """
+    Build a 400 response if options select a method the detector does not provide
+    
+    The page lists every method, but spaCy and fastText are only registered
+    when their models are installed.
+    
+    Args:
+        options: DetectOptions for the request
+        
+    Returns:
+        400 response, or None if the method is available
+    """
+    if options.method and options.method not in _get_detector().methods:
+        return _json({'error': f'Unknown detection method: {options.method}'}, 400)
+    return None
+
+def _cached_detect(text, options):
+    """
+    Detect language of text, reusing the result of an identical earlier request
+    
+    Args:
+        text: Input text to detect
+        options: DetectOptions for the request
+        
+    Returns:
+        Dictionary with detection results, including confidence_formatted
+    """
+    cacheable = len(text) <= CACHE_MAX_TEXT_LENGTH
+    key = (text, options)
+    
+    if cacheable:
+        with _result_cache_lock:
+            result = _result_cache.get(key)
+            if result is not None:
+                _result_cache.move_to_end(key)
+                return result
+    
+    result = _get_detector().detect(
+        text,
+        method=options.method,
+        advanced_cleaning=options.advanced_cleaning,
+        remove_punct=options.remove_punct,
+        remove_nums=options.remove_nums,
+        remove_special=options.remove_special
+    )
+    
+    # Format confidence for display
+    result['confidence_formatted'] = format_confidence(result['confidence'])
+    
+    # Results affected by a backend error are not cached, so the text is
+    # detected again once the backend recovers
+    if cacheable and not _has_failed_method(result):
+        with _result_cache_lock:
+            _result_cache[key] = result
+            if len(_result_cache) > RESULT_CACHE_SIZE:
+                _result_cache.popitem(last=False)
+    
+    return result
+
+def _has_failed_method(result):
+    """Whether the method of result, or any method it combines, raised an error"""
+    return result.get('failed', False) or any(
+        method_result.get('failed', False)
+        for method_result in result.get('all_results', {}).values()
+    )
 
 @app.route('/')
 def index():
-    """Render the main page"""
-    return render_template('index.html')
+    """Serve the main page, answering revalidations with 304 Not Modified"""
+    response = _not_modified(_INDEX_ETAG, match_any=True)
+    if response is None:
+        response = Response(_INDEX_HTML, mimetype='text/html')
+        response.set_etag(_INDEX_ETAG)
+    response.headers['Cache-Control'] = 'public, max-age=3600'
+    return response
 
 @app.route('/detect', methods=['POST'])
 def detect_language():
     """API endpoint to detect language"""
-    data = request.get_json()
+    body = request.get_data()
+    
+    # Detection results depend only on the request, so a client that already
+    # holds the response for an identical body can reuse it. "*" is not
+    # honoured: it would answer any body, valid or not, with a 304.
+    etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+    response = _not_modified(etag)
+    if response is not None:
+        response.headers['Cache-Control'] = DETECT_CACHE_CONTROL
+        return response
+    
+    try:
+        text, options = _parse_payload(body, 'text')
+    except ValueError as e:
+        return _json({'error': str(e)}, 400)
+    
+    if not isinstance(text, str):
+        return _json({'error': 'text must be a string'}, 400)
+    # Truncate first, so text that is blank within the limit is rejected too
+    text = text[:MAX_TEXT_LENGTH]
+    if not text.strip():
+        return _json({'error': 'No text provided'}, 400)
     
-    if not data or 'text' not in data:
-        return jsonify({'error': 'No text provided'}), 400
+    response = _unknown_method(options)
+    if response is not None:
+        return response
+    options = _pooled_options(options)
     
-    text = data.get('text', '')
-    method = data.get('method')
-    advanced_cleaning = data.get('advanced_cleaning', False)
-    remove_punct = data.get('remove_punct', True)
-    remove_nums = data.get('remove_nums', False)
-    remove_special = data.get('remove_special', False)
+    try:
+        result = _cached_detect(text, options)
+        response = _json(result)
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = DETECT_CACHE_CONTROL
+        return response
+    except Exception as e:
+        app.logger.exception('Language detection failed')
+        return _json({'error': str(e)[:MAX_ERROR_LENGTH]}, 500)
+
+@app.route('/detect_batch', methods=['POST'])
+def detect_language_batch():
+    """API endpoint to detect the language of several texts at once"""
+    try:
+        texts, options = _parse_payload(request.get_data(), 'texts')
+    except ValueError as e:
+        return _json({'error': str(e)}, 400)
+    
+    if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+        return _json({'error': 'texts must be a list of strings'}, 400)
+    if len(texts) > MAX_BATCH_SIZE:
+        return _json({'error': f'At most {MAX_BATCH_SIZE} texts per batch'}, 400)
+    if not texts:
+        return _json({'results': []})
+    texts = [text[:MAX_TEXT_LENGTH] for text in texts]
+    
+    response = _unknown_method(options)
+    if response is not None:
+        return response
     
     try:
-        result = detector.detect(
-            text,
-            method=method,
-            advanced_cleaning=advanced_cleaning,
-            remove_punct=remove_punct,
-            remove_nums=remove_nums,
-            remove_special=remove_special
+        results = _get_detector().detect_batch(
+            texts,
+            workers=MAX_BATCH_WORKERS,
+            method=options.method,
+            advanced_cleaning=options.advanced_cleaning,
+            remove_punct=options.remove_punct,
+            remove_nums=options.remove_nums,
+            remove_special=options.remove_special
         )
         
         # Format confidence for display
-        result['confidence_formatted'] = format_confidence(result['confidence'])
+        for result in results:
+            result['confidence_formatted'] = format_confidence(result['confidence'])
         
-        return jsonify(result)
+        return _json({'results': results})
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        app.logger.exception('Batch language detection failed')
+        return _json({'error': str(e)[:MAX_ERROR_LENGTH]}, 500)
 
 def main():
     """Run the web application"""
@@ -61,296 +355,51 @@ def main():
     parser.add_argument('--host', type=str, default='0.0.0.0', help='Host to run the server on')
     parser.add_argument('--port', type=int, default=5000, help='Port to run the server on')
     parser.add_argument('--debug', action='store_true', help='Run in debug mode')
+    parser.add_argument('--workers', type=int, default=2, help='Number of gunicorn worker processes')
+    parser.add_argument('--threads', type=int, default=8, help='Number of request threads per worker')
     
     args = parser.parse_args()
     
-    # Create templates directory if it doesn't exist
-    os.makedirs(os.path.join(os.path.dirname(__file__), 'templates'), exist_ok=True)
+    print(f"Starting web server on http://{args.host}:{args.port}")
+    if args.debug:
+        app.run(host=args.host, port=args.port, debug=True)
+        return
     
-    # Create index.html template
-    with open(os.path.join(os.path.dirname(__file__), 'templates', 'index.html'), 'w') as f:
-        f.write("""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Language Detection Tool</title>
-    <style>
-        body {
-            font-family: Arial, sans-serif;
-            line-height: 1.6;
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 20px;
-            color: #333;
-        }
-        h1 {
-            color: #2c3e50;
-            text-align: center;
-            margin-bottom: 30px;
-        }
-        .container {
-            background-color: #f9f9f9;
-            border-radius: 8px;
-            padding: 20px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-        textarea {
-            width: 100%;
-            padding: 10px;
-            border: 1px solid #ddd;
-            border-radius: 4px;
-            min-height: 100px;
-            margin-bottom: 15px;
-            font-family: inherit;
-        }
-        button {
-            background-color: #3498db;
-            color: white;
-            border: none;
-            padding: 10px 15px;
-            border-radius: 4px;
-            cursor: pointer;
-            font-size: 16px;
-        }
-        button:hover {
-            background-color: #2980b9;
-        }
-        .settings {
-            margin: 20px 0;
-            padding: 15px;
-            background-color: #f0f0f0;
-            border-radius: 4px;
-        }
-        .settings h3 {
-            margin-top: 0;
-        }
-        .settings label {
-            display: block;
-            margin: 10px 0;
-        }
-        .settings select {
-            padding: 5px;
-            border-radius: 4px;
-            border: 1px solid #ddd;
-        }
-        .result {
-            margin-top: 20px;
-            padding: 15px;
-            background-color: #e8f4fc;
-            border-radius: 4px;
-            display: none;
-        }
-        .result h3 {
-            margin-top: 0;
-            color: #2c3e50;
-        }
-        .result-item {
-            margin-bottom: 10px;
-        }
-        .result-label {
-            font-weight: bold;
-        }
-        .toggle-settings {
-            background: none;
-            border: none;
-            color: #3498db;
-            cursor: pointer;
-            padding: 0;
-            font-size: 14px;
-            margin-bottom: 10px;
-            text-decoration: underline;
-        }
-        .error {
-            color: #e74c3c;
-            margin-top: 10px;
-            font-weight: bold;
-        }
-    </style>
-</head>
-<body>
-    <h1>Language Detection Tool</h1>
+    try:
+        _serve_with_gunicorn(args.host, args.port, args.workers, args.threads)
+    except ImportError:
+        # gunicorn is not available on Windows
+        app.logger.warning('gunicorn is not installed, falling back to the development server')
+        app.run(host=args.host, port=args.port, threaded=True)
+
+def _serve_with_gunicorn(host, port, workers, threads):
+    """
+    Serve the app with gunicorn using threaded workers
     
-    <div class="container">
-        <p>Enter text below to detect its language:</p>
-        <textarea id="text-input" placeholder="Type or paste text here..."></textarea>
-        
-        <button type="button" class="toggle-settings" id="toggle-settings">Show Advanced Settings</button>
-        
-        <div class="settings" id="settings" style="display: none;">
-            <h3>Detection Settings</h3>
-            
-            <label>
-                Detection Method:
-                <select id="method">
-                    <option value="">Combined (Best Result)</option>
-                    <option value="langdetect">Langdetect</option>
-                    <option value="textblob">TextBlob</option>
-                    <option value="googletrans">Google Translate</option>
-                    <option value="spacy">spaCy</option>
-                </select>
-            </label>
-            
-            <label>
-                <input type="checkbox" id="advanced-cleaning"> 
-                Use Advanced Text Cleaning
-            </label>
-            
-            <label>
-                <input type="checkbox" id="remove-punct" checked> 
-                Remove Punctuation
-            </label>
-            
-            <label>
-                <input type="checkbox" id="remove-nums"> 
-                Remove Numbers
-            </label>
-            
-            <label>
-                <input type="checkbox" id="remove-special"> 
-                Remove Special Characters
-            </label>
-        </div>
-        
-        <button id="detect-btn">Detect Language</button>
-        
-        <div class="error" id="error" style="display: none;"></div>
-        
-        <div class="result" id="result">
-            <h3>Detection Results</h3>
-            
-            <div class="result-item">
-                <span class="result-label">Detected Language:</span>
-                <span id="language"></span>
-            </div>
-            
-            <div class="result-item">
-                <span class="result-label">Language Family:</span>
-                <span id="language-family"></span>
-            </div>
-            
-            <div class="result-item">
-                <span class="result-label">Confidence:</span>
-                <span id="confidence"></span>
-            </div>
-            
-            <div class="result-item">
-                <span class="result-label">Is English:</span>
-                <span id="is-english"></span>
-            </div>
-            
-            <div class="result-item">
-                <span class="result-label">Detection Method:</span>
-                <span id="detection-method"></span>
-            </div>
-            
-            <div class="result-item" id="cleaned-text-container" style="display: none;">
-                <span class="result-label">Cleaned Text:</span>
-                <span id="cleaned-text"></span>
-            </div>
-        </div>
-    </div>
+    Args:
+        host: Host to bind to
+        port: Port to bind to
+        workers: Number of worker processes
+        threads: Number of request threads per worker
+    """
+    from gunicorn.app.base import BaseApplication
     
-    <script>
-        document.addEventListener('DOMContentLoaded', function() {
-            const textInput = document.getElementById('text-input');
-            const detectBtn = document.getElementById('detect-btn');
-            const methodSelect = document.getElementById('method');
-            const advancedCleaningCheckbox = document.getElementById('advanced-cleaning');
-            const removePunctCheckbox = document.getElementById('remove-punct');
-            const removeNumsCheckbox = document.getElementById('remove-nums');
-            const removeSpecialCheckbox = document.getElementById('remove-special');
-            const resultDiv = document.getElementById('result');
-            const errorDiv = document.getElementById('error');
-            const toggleSettingsBtn = document.getElementById('toggle-settings');
-            const settingsDiv = document.getElementById('settings');
-            const cleanedTextContainer = document.getElementById('cleaned-text-container');
-            
-            // Toggle settings visibility
-            toggleSettingsBtn.addEventListener('click', function() {
-                if (settingsDiv.style.display === 'none') {
-                    settingsDiv.style.display = 'block';
-                    toggleSettingsBtn.textContent = 'Hide Advanced Settings';
-                } else {
-                    settingsDiv.style.display = 'none';
-                    toggleSettingsBtn.textContent = 'Show Advanced Settings';
-                }
-            });
-            
-            // Detect language on button click
-            detectBtn.addEventListener('click', function() {
-                const text = textInput.value.trim();
-                
-                if (!text) {
-                    errorDiv.textContent = 'Please enter some text to detect.';
-                    errorDiv.style.display = 'block';
-                    resultDiv.style.display = 'none';
-                    return;
-                }
-                
-                errorDiv.style.display = 'none';
-                
-                // Get settings
-                const method = methodSelect.value || null;
-                const advancedCleaning = advancedCleaningCheckbox.checked;
-                const removePunct = removePunctCheckbox.checked;
-                const removeNums = removeNumsCheckbox.checked;
-                const removeSpecial = removeSpecialCheckbox.checked;
-                
-                // Send request to API
-                fetch('/detect', {
-                    method: 'POST',
-                    headers: {
-                        'Content-Type': 'application/json'
-                    },
-                    body: JSON.stringify({
-                        text: text,
-                        method: method,
-                        advanced_cleaning: advancedCleaning,
-                        remove_punct: removePunct,
-                        remove_nums: removeNums,
-                        remove_special: removeSpecial
-                    })
-                })
-                .then(response => response.json())
-                .then(data => {
-                    if (data.error) {
-                        errorDiv.textContent = data.error;
-                        errorDiv.style.display = 'block';
-                        resultDiv.style.display = 'none';
-                        return;
-                    }
-                    
-                    // Display results
-                    document.getElementById('language').textContent = `${data.language} (${data.language_code})`;
-                    document.getElementById('language-family').textContent = data.language_family;
-                    document.getElementById('confidence').textContent = data.confidence_formatted;
-                    document.getElementById('is-english').textContent = data.is_english ? 'Yes' : 'No';
-                    document.getElementById('detection-method').textContent = data.method;
-                    
-                    // Show cleaned text if advanced cleaning is enabled
-                    if (advancedCleaning) {
-                        document.getElementById('cleaned-text').textContent = data.cleaned_text;
-                        cleanedTextContainer.style.display = 'block';
-                    } else {
-                        cleanedTextContainer.style.display = 'none';
-                    }
-                    
-                    resultDiv.style.display = 'block';
-                })
-                .catch(error => {
-                    errorDiv.textContent = 'An error occurred: ' + error.message;
-                    errorDiv.style.display = 'block';
-                    resultDiv.style.display = 'none';
-                });
-            });
-        });
-    </script>
-</body>
-</html>""")
+    class Server(BaseApplication):
+        def load_config(self):
+            self.cfg.set('bind', f'{host}:{port}')
+            self.cfg.set('workers', workers)
+            self.cfg.set('worker_class', 'gthread')
+            self.cfg.set('threads', threads)
+        
+        def load(self):
+            return app
     
-    print(f"Starting web server on http://{args.host}:{args.port}")
-    app.run(host=args.host, port=args.port, debug=args.debug)
+    Server().run()
+
+# Load the detection models at import time, before gunicorn forks its workers,
+# instead of on the first /detect request
+if os.environ.get('PRELOAD_WARMUP') == '1':
+    _get_detector().warmup()
 
 if __name__ == "__main__":
     main()